@@ -13,7 +13,6 @@ from enum import Enum
 from pytz import utc
 from rest_framework.authentication import SessionAuthentication
 from rest_framework.parsers import JSONParser
-from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from simplejson import JSONDecodeError
@@ -32,6 +31,7 @@ from sentry.utils import json
 from .authentication import ApiKeyAuthentication, TokenAuthentication
 from .paginator import BadPaginationError, Paginator
 from .permissions import NoPermission
+from .renderers import JSONRenderer
 
 
 __all__ = ['DocSection', 'Endpoint', 'EnvironmentMixin', 'StatsMixin']
@@ -40,6 +40,13 @@ ONE_MINUTE = 60
 ONE_HOUR = ONE_MINUTE * 60
 ONE_DAY = ONE_HOUR * 24
 
+RESOLUTION_UNITS = {
+    's': 1,
+    'm': ONE_MINUTE,
+    'h': ONE_HOUR,
+    'd': ONE_DAY,
+}
+
 LINK_HEADER = '<{uri}&cursor={cursor}>; rel="{name}"; results="{has_results}"; cursor="{cursor}"'
 
 DEFAULT_AUTHENTICATION = (
@@ -64,16 +71,19 @@ class Endpoint(APIView):
     parser_classes = (JSONParser, )
     permission_classes = (NoPermission, )
 
-    def build_cursor_link(self, request, name, cursor):
+    def build_cursor_base_url(self, request):
         querystring = u'&'.join(
             u'{0}={1}'.format(urlquote(k), urlquote(v)) for k, v in six.iteritems(request.GET)
             if k != 'cursor'
         )
         base_url = absolute_uri(urlquote(request.path))
         if querystring:
-            base_url = u'{0}?{1}'.format(base_url, querystring)
-        else:
-            base_url = base_url + '?'
+            return u'{0}?{1}'.format(base_url, querystring)
+        return base_url + '?'
+
+    def build_cursor_link(self, request, name, cursor, base_url=None):
+        if base_url is None:
+            base_url = self.build_cursor_base_url(request)
 
         return LINK_HEADER.format(
             uri=base_url,
@@ -162,8 +172,9 @@ class Endpoint(APIView):
         # the request (happens via middleware/stats.py).
         request._metric_tags = {}
 
-        if settings.SENTRY_API_RESPONSE_DELAY:
-            time.sleep(settings.SENTRY_API_RESPONSE_DELAY / 1000.0)
+        response_delay = settings.SENTRY_API_RESPONSE_DELAY
+        if response_delay:
+            time.sleep(response_delay / 1000.0)
 
         origin = request.META.get('HTTP_ORIGIN', 'null')
         # A "null" value should be treated as no Origin for us.
@@ -184,9 +195,9 @@ class Endpoint(APIView):
             self.initial(request, *args, **kwargs)
 
             # Get the appropriate handler method
-            if request.method.lower() in self.http_method_names:
-                handler = getattr(self, request.method.lower(),
-                                  self.http_method_not_allowed)
+            method = request.method.lower()
+            if method in self.http_method_names:
+                handler = getattr(self, method, self.http_method_not_allowed)
 
                 (args, kwargs) = self.convert_args(request, *args, **kwargs)
                 self.args = args
@@ -221,11 +232,14 @@ class Endpoint(APIView):
             response['X-Hits'] = cursor_result.hits
         if cursor_result.max_hits is not None:
             response['X-Max-Hits'] = cursor_result.max_hits
+        # The base url is the same for both links, so only build it once.
+        base_url = self.build_cursor_base_url(request)
         response['Link'] = ', '.join(
             [
                 self.build_cursor_link(
-                    request, 'previous', cursor_result.prev),
-                self.build_cursor_link(request, 'next', cursor_result.next),
+                    request, 'previous', cursor_result.prev, base_url=base_url),
+                self.build_cursor_link(
+                    request, 'next', cursor_result.next, base_url=base_url),
             ]
         )
 
@@ -238,16 +252,14 @@ class Endpoint(APIView):
     ):
         assert (paginator and not paginator_kwargs) or (paginator_cls and paginator_kwargs)
 
-        per_page = int(request.GET.get('per_page', default_per_page))
-        input_cursor = request.GET.get('cursor')
-        if input_cursor:
-            input_cursor = Cursor.from_string(input_cursor)
-        else:
-            input_cursor = None
-
+        params = request.GET
+        per_page = int(params.get('per_page', default_per_page))
         assert per_page <= max(max_per_page, default_per_page)
 
-        if not paginator:
+        input_cursor = params.get('cursor')
+        input_cursor = Cursor.from_string(input_cursor) if input_cursor else None
+
+        if paginator is None:
             paginator = paginator_cls(**paginator_kwargs)
 
         try:
@@ -258,11 +270,10 @@ class Endpoint(APIView):
         except BadPaginationError as e:
             return Response({'detail': e.message}, status=400)
 
+        results = cursor_result.results
         # map results based on callback
-        if on_results:
-            results = on_results(cursor_result.results)
-        else:
-            results = cursor_result.results
+        if on_results is not None:
+            results = on_results(results)
 
         response = Response(results)
         self.add_cursor_headers(request, response, cursor_result)
@@ -311,18 +322,20 @@ class EnvironmentMixin(object):
 
 class StatsMixin(object):
     def _parse_args(self, request, environment_id=None):
-        resolution = request.GET.get('resolution')
+        params = request.GET
+
+        resolution = params.get('resolution')
         if resolution:
             resolution = self._parse_resolution(resolution)
             assert resolution in tsdb.get_rollups()
 
-        end = request.GET.get('until')
+        end = params.get('until')
         if end:
             end = to_datetime(float(end))
         else:
-            end = datetime.utcnow().replace(tzinfo=utc)
+            end = datetime.now(utc)
 
-        start = request.GET.get('since')
+        start = params.get('since')
         if start:
             start = to_datetime(float(start))
             assert start <= end, 'start must be before or equal to end'
@@ -340,13 +353,7 @@ class StatsMixin(object):
         }
 
     def _parse_resolution(self, value):
-        if value.endswith('h'):
-            return int(value[:-1]) * ONE_HOUR
-        elif value.endswith('d'):
-            return int(value[:-1]) * ONE_DAY
-        elif value.endswith('m'):
-            return int(value[:-1]) * ONE_MINUTE
-        elif value.endswith('s'):
-            return int(value[:-1])
-        else:
+        try:
+            return int(value[:-1]) * RESOLUTION_UNITS[value[-1:]]
+        except KeyError:
             raise ValueError(value)
@@ -0,0 +1,45 @@
+from __future__ import absolute_import
+
+import six
+
+from rest_framework.renderers import JSONRenderer as BaseJSONRenderer
+from rest_framework.utils.encoders import JSONEncoder as RestFrameworkJSONEncoder
+from simplejson import JSONEncoder
+
+# Rest framework creates a renderer per request, so share one encoder.
+_encoder = JSONEncoder(
+    separators=(',', ':'),
+    ensure_ascii=BaseJSONRenderer.ensure_ascii,
+    use_decimal=False,
+    namedtuple_as_object=False,
+    default=RestFrameworkJSONEncoder().default,
+)
+
+
+class JSONRenderer(BaseJSONRenderer):
+    """
+    Identical to rest framework's ``JSONRenderer`` except that compact
+    responses are encoded with simplejson, like ``sentry.utils.json``,
+    instead of the standard library ``json`` module, which is measurably
+    faster for API responses.
+
+    Values simplejson does not understand are still handed to rest
+    framework's encoder so the output is unchanged.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return bytes()
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is not None or not self.compact:
+            return super(JSONRenderer, self).render(
+                data, accepted_media_type, renderer_context)
+
+        ret = _encoder.encode(data)
+        if isinstance(ret, six.text_type):
+            # See rest framework's JSONRenderer: keep output a strict
+            # javascript subset.
+            ret = ret.replace(u'\u2028', u'\\u2028').replace(u'\u2029', u'\\u2029')
+            return ret.encode('utf-8')
+        return ret
@@ -2,9 +2,11 @@ from __future__ import absolute_import
 
 import re
 import six
+import string
 import logging
 
-from sentry.stacktraces.processing import find_stacktraces_in_data
+from functools32 import lru_cache
+
 from sentry.utils.safe import get_path
 
 logger = logging.getLogger(__name__)
@@ -12,8 +14,8 @@ logger = logging.getLogger(__name__)
 # Regex to parse OS versions from a minidump OS string.
 VERSION_RE = re.compile(r'(\d+\.\d+\.\d+)\s+(.*)')
 
-# Regex to guess whether we're dealing with Windows or Unix paths.
-WINDOWS_PATH_RE = re.compile(r'^([a-z]:\\|\\\\)', re.IGNORECASE)
+# Drive letters that start an absolute Windows path, e.g. ``C:\``.
+WINDOWS_DRIVE_LETTERS = frozenset(string.ascii_letters)
 
 # Event platforms that could contain native stacktraces
 NATIVE_PLATFORMS = ('cocoa', 'native')
@@ -45,13 +47,26 @@ def native_images_from_data(data):
                     filter=is_native_image)
 
 
+def _iter_stacktraces(data):
+    # Same traversal as ``find_stacktraces_in_data``, but lazy and without
+    # building ``StacktraceInfo`` objects.
+    for exc in get_path(data, 'exception', 'values', filter=True, default=()):
+        yield exc.get('stacktrace')
+
+    yield data.get('stacktrace')
+
+    for thread in get_path(data, 'threads', 'values', filter=True, default=()):
+        yield thread.get('stacktrace')
+
+
 def is_native_event(data):
     if is_native_platform(data.get('platform')):
         return True
 
-    for stacktrace in find_stacktraces_in_data(data):
-        if any(is_native_platform(x) for x in stacktrace.platforms):
-            return True
+    for stacktrace in _iter_stacktraces(data):
+        for frame in get_path(stacktrace, 'frames', filter=True, default=()):
+            if is_native_platform(frame.get('platform')):
+                return True
 
     return False
 
@@ -61,10 +76,20 @@ def is_minidump_event(data):
     return get_path(exceptions, 0, 'mechanism', 'type') in ('minidump', 'unreal')
 
 
+def is_windows_path(path):
+    """
+    Guesses whether we're dealing with a Windows or Unix path. Windows paths
+    start with a drive letter (``C:\\``) or a UNC prefix (``\\\\``).
+    """
+    if path[1:3] == ':\\':
+        return path[0] in WINDOWS_DRIVE_LETTERS
+    return path.startswith('\\\\')
+
+
 def image_name(pkg):
     if not pkg:
         return pkg
-    split = '\\' if WINDOWS_PATH_RE.match(pkg) else '/'
+    split = '\\' if is_windows_path(pkg) else '/'
     return pkg.rsplit(split, 1)[-1]
 
 
@@ -78,14 +103,23 @@ def get_sdk_from_event(event):
         return get_sdk_from_os(os)
 
 
+@lru_cache(maxsize=4096)
+def _parse_os_version(version):
+    # OS versions have a low cardinality across events, so cache the parsed
+    # tuples. Invalid versions are cached as ``None``.
+    version = version.split('-', 1)[0] + '.0' * 3
+    try:
+        return tuple(int(x) for x in version.split('.')[:3])
+    except ValueError:
+        return None
+
+
 def get_sdk_from_os(data):
     if data.get('name') is None or data.get('version') is None:
         return
 
-    try:
-        version = six.text_type(data['version']).split('-', 1)[0] + '.0' * 3
-        system_version = tuple(int(x) for x in version.split('.')[:3])
-    except ValueError:
+    system_version = _parse_os_version(six.text_type(data['version']))
+    if system_version is None:
         return
 
     return {
@@ -191,3 +191,5 @@ register('store.disable-trim-in-renormalization', default=0.0)  # unused
 register('post-process.use-error-hook-sampling', default=False)
 # From 0.0 to 1.0: Randomly enqueue process_resource_change task
 register('post-process.error-hook-sample-rate', default=0.0)
+# Seconds to cache that a project has no error.created service hooks
+register('post-process.error-hook-negative-cache-ttl', default=60)
@@ -9,7 +9,6 @@ sentry.tasks.post_process
 from __future__ import absolute_import, print_function
 
 import logging
-import time
 
 from django.conf import settings
 
@@ -29,17 +28,34 @@ from sentry.utils.sdk import configure_scope
 
 logger = logging.getLogger('sentry')
 
+# Bit flags for the service hook events fired from post processing.
+SERVICE_HOOK_EVENT_FLAGS = {
+    'event.created': 1 << 0,
+    'event.alert': 1 << 1,
+}
+
 
 def _get_service_hooks(project_id):
+    """
+    Returns a tuple of service hook ids and a parallel tuple of the
+    ``SERVICE_HOOK_EVENT_FLAGS`` each hook is subscribed to.
+    """
     from sentry.models import ServiceHook
-    cache_key = u'servicehooks:1:{}'.format(project_id)
+    cache_key = u'servicehooks:2:{}'.format(project_id)
     result = cache.get(cache_key)
 
     if result is None:
         hooks = ServiceHook.objects.filter(
             servicehookproject__project_id=project_id,
         )
-        result = [(h.id, h.events) for h in hooks]
+        ids = []
+        event_flags = []
+        for h in hooks:
+            ids.append(h.id)
+            event_flags.append(
+                sum(SERVICE_HOOK_EVENT_FLAGS.get(e, 0) for e in set(h.events)),
+            )
+        result = (tuple(ids), tuple(event_flags))
         cache.set(cache_key, result, 60)
     return result
 
@@ -69,18 +85,23 @@ def _should_send_error_created_hooks(project):
     result = cache.get(cache_key)
 
     if result is None:
+        # Most organizations never set up these hooks, so negative results
+        # can be cached for longer to keep the queries off the hot path.
+        negative_ttl = options.get('post-process.error-hook-negative-cache-ttl')
 
         org = Organization.objects.get_from_cache(id=project.organization_id)
         if not features.has('organizations:integrations-event-hooks', organization=org):
-            cache.set(cache_key, 0, 60)
+            cache.set(cache_key, 0, negative_ttl)
             return False
 
         result = ServiceHook.objects.filter(
             organization_id=org.id,
         ).extra(where=["events @> '{error.created}'"]).exists()
 
-        cache_value = 1 if result else 0
-        cache.set(cache_key, cache_value, 60)
+        if result:
+            cache.set(cache_key, 1, 60)
+        else:
+            cache.set(cache_key, 0, negative_ttl)
 
     return result
 
@@ -110,9 +131,10 @@ def check_event_already_post_processed(event):
         return
 
     client = redis_clusters.get(cluster_key)
+    # Only the presence of the key matters, so store the smallest value.
     result = client.set(
-        u'pp:{}/{}'.format(event.project_id, event.event_id),
-        u'{:.0f}'.format(time.time()),
+        'pp:%s/%s' % (event.project_id, event.event_id),
+        '1',
         ex=60 * 60,
         nx=True,
     )
@@ -137,6 +159,10 @@ def post_process_group(event, is_new, is_regression, is_sample, is_new_group_env
     """
     Fires post processing hooks for a group.
     """
+    # The callback form of configure_scope avoids setting up a context
+    # manager for a single tag.
+    configure_scope(lambda scope: scope.set_tag("project", event.project_id))
+
     with snuba.options_override({'consistent': True}):
         if check_event_already_post_processed(event):
             logger.info('post_process.skipped', extra={
@@ -152,7 +178,7 @@ def post_process_group(event, is_new, is_regression, is_sample, is_new_group_env
         from sentry.models import Project
         from sentry.models.group import get_group_with_redirect
         from sentry.rules.processor import RuleProcessor
-        from sentry.tasks.servicehooks import process_service_hook
+        from sentry.tasks.servicehooks import process_service_hooks
 
         # Re-bind node data to avoid renormalization. We only want to
         # renormalize when loading old data from the database.
@@ -164,8 +190,6 @@ def post_process_group(event, is_new, is_regression, is_sample, is_new_group_env
         event.group_id = event.group.id
 
         project_id = event.group.project_id
-        with configure_scope() as scope:
-            scope.set_tag("project", project_id)
 
         # Re-bind Project since we're pickling the whole Event object
         # which may contain a stale Project.
@@ -190,17 +214,21 @@ def post_process_group(event, is_new, is_regression, is_sample, is_new_group_env
             'projects:servicehooks',
             project=event.project,
         ):
-            allowed_events = set(['event.created'])
+            allowed_mask = SERVICE_HOOK_EVENT_FLAGS['event.created']
             if has_alert:
-                allowed_events.add('event.alert')
-
-            if allowed_events:
-                for servicehook_id, events in _get_service_hooks(project_id=event.project_id):
-                    if any(e in allowed_events for e in events):
-                        process_service_hook.delay(
-                            servicehook_id=servicehook_id,
-                            event=event,
-                        )
+                allowed_mask |= SERVICE_HOOK_EVENT_FLAGS['event.alert']
+
+            hook_ids, hook_flags = _get_service_hooks(project_id=event.project_id)
+            servicehook_ids = [
+                hook_id
+                for hook_id, flags in zip(hook_ids, hook_flags)
+                if flags & allowed_mask
+            ]
+            if servicehook_ids:
+                process_service_hooks.delay(
+                    servicehook_ids=servicehook_ids,
+                    event=event,
+                )
 
         if event.get_event_type() == 'error' and _should_send_error_created_hooks(event.project):
             process_resource_change_bound.delay(
@@ -264,8 +292,7 @@ def plugin_post_process_group(plugin_slug, event, **kwargs):
     """
     Fires post processing hooks for a group.
     """
-    with configure_scope() as scope:
-        scope.set_tag("project", event.project_id)
+    configure_scope(lambda scope: scope.set_tag("project", event.project_id))
 
     plugin = plugins.get(plugin_slug)
     safe_execute(
@@ -286,8 +313,7 @@ def index_event_tags(organization_id, project_id, event_id, tags,
                      group_id, environment_id, date_added=None, **kwargs):
     from sentry import tagstore
 
-    with configure_scope() as scope:
-        scope.set_tag("project", project_id)
+    configure_scope(lambda scope: scope.set_tag("project", project_id))
 
     create_event_tags_kwargs = {}
     if date_added is not None:
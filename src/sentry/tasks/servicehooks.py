@@ -10,6 +10,7 @@ from sentry.models import ServiceHook
 from sentry.tasks.base import instrumented_task
 from sentry.utils import json
 from sentry.utils.http import absolute_uri
+from sentry.utils.safe import safe_execute
 
 
 def get_payload_v0(event):
@@ -77,3 +78,18 @@ def process_service_hook(servicehook_id, event, **kwargs):
         timeout=5,
         verify_ssl=False,
     )
+
+
+@instrumented_task(name='sentry.tasks.process_service_hooks')
+def process_service_hooks(servicehook_ids, event, **kwargs):
+    """
+    Fires a batch of service hooks for the same event, so the event only
+    has to be sent over the broker once.
+    """
+    for servicehook_id in servicehook_ids:
+        safe_execute(
+            process_service_hook,
+            servicehook_id=servicehook_id,
+            event=event,
+            _with_transaction=False,
+        )
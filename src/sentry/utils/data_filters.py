@@ -9,9 +9,11 @@ from __future__ import absolute_import
 
 import fnmatch
 import ipaddress
+import re
 import six
 
 from django.utils.encoding import force_text
+from functools32 import lru_cache
 
 from sentry import tsdb
 
@@ -48,6 +50,26 @@ class FilterTypes(object):
     RELEASES = 'releases'
 
 
+@lru_cache(maxsize=500)
+def _compile_ip_blacklist(blacklist):
+    """
+    Splits a tuple of blacklisted IPs into a set of values for exact
+    matches and the parsed networks of all ranges, so neither has to be
+    rebuilt per event.
+    """
+    networks = []
+    for addr in blacklist:
+        # Check to make sure it's actually a range before
+        if '/' not in addr:
+            continue
+        try:
+            networks.append(ipaddress.ip_network(six.text_type(addr), strict=False))
+        except ValueError:
+            # Ignore invalid values here
+            pass
+    return frozenset(blacklist), tuple(networks)
+
+
 def is_valid_ip(relay_config, ip_address):
     """
     Verify that an IP address is not being blacklisted
@@ -57,24 +79,55 @@ def is_valid_ip(relay_config, ip_address):
     if not blacklist:
         return True
 
-    for addr in blacklist:
-        # We want to error fast if it's an exact match
-        if ip_address == addr:
+    exact, networks = _compile_ip_blacklist(tuple(blacklist))
+
+    # We want to error fast if it's an exact match
+    if ip_address in exact:
+        return False
+
+    if not networks:
+        return True
+
+    try:
+        ip = ipaddress.ip_address(six.text_type(ip_address))
+    except ValueError:
+        return True
+
+    for network in networks:
+        if ip in network:
             return False
 
-        # Check to make sure it's actually a range before
+    return True
+
+
+@lru_cache(maxsize=500)
+def _compile_patterns(patterns):
+    """
+    Translates a tuple of glob patterns into a single compiled regular
+    expression so they are only compiled once per filter setting and
+    matched with one scan per event. Patterns are lowercased, so values
+    must be lowercased before matching.
+    """
+    translated = []
+    for pattern in patterns:
+        regex = fnmatch.translate(pattern.lower())
         try:
-            if '/' in addr and (
-                ipaddress.ip_address(six.text_type(ip_address)) in ipaddress.ip_network(
-                    six.text_type(addr), strict=False
-                )
-            ):
-                return False
-        except ValueError:
-            # Ignore invalid values here
-            pass
+            re.compile(regex)
+        except re.error:
+            # Patterns come from end users and can be full of mistakes.
+            continue
+        translated.append(u'(?:%s)' % regex)
 
-    return True
+    if not translated:
+        return None
+    return re.compile(u'|'.join(translated))
+
+
+def _matches_any(value, patterns):
+    regex = _compile_patterns(tuple(patterns))
+    if regex is None:
+        return False
+    return regex.match(force_text(value).lower()) is not None
 
 
 def is_valid_release(relay_config, release):
@@ -86,13 +139,7 @@ def is_valid_release(relay_config, release):
     if not invalid_versions:
         return True
 
-    release = force_text(release).lower()
-
-    for version in invalid_versions:
-        if fnmatch.fnmatch(release, version.lower()):
-            return False
-
-    return True
+    return not _matches_any(release, invalid_versions)
 
 
 def is_valid_error_message(relay_config, message):
@@ -104,15 +151,4 @@ def is_valid_error_message(relay_config, message):
     if not filtered_errors:
         return True
 
-    message = force_text(message).lower()
-
-    for error in filtered_errors:
-        try:
-            if fnmatch.fnmatch(message, error.lower()):
-                return False
-        except Exception:
-            # fnmatch raises a string when the pattern is bad.
-            # Patterns come from end users and can be full of mistakes.
-            pass
-
-    return True
+    return not _matches_any(message, filtered_errors)
@@ -8,6 +8,7 @@ sentry.web.forms
 from __future__ import absolute_import
 
 from django import forms
+from django.db import transaction
 from django.utils.translation import ugettext_lazy as _
 
 from sentry.models import User, Activity
@@ -39,13 +40,15 @@ class ChangeUserForm(BaseUserForm):
         model = User
 
     def __init__(self, *args, **kwargs):
+        instance = kwargs['instance']
         super(ChangeUserForm, self).__init__(*args, **kwargs)
-        self.user = kwargs['instance']
-        if self.user.is_managed:
+        self.user = instance
+        self._is_managed = instance.is_managed
+        if self._is_managed:
             self.fields['username'] = ReadOnlyTextField(label="Username (managed)")
 
     def clean_username(self):
-        if self.user.is_managed:
+        if self._is_managed:
             return self.user.username
         return self.cleaned_data['username']
 
@@ -67,13 +70,19 @@ class NewNoteForm(forms.Form):
     )
 
     def save(self, group, user, event=None):
-        activity = Activity.objects.create(
-            group=group,
-            project=group.project,
-            type=Activity.NOTE,
-            user=user,
-            data=self.cleaned_data
-        )
+        # Creating the activity also bumps the group's comment count; commit
+        # both together before queueing the notification. This only makes
+        # the row visible to the worker when there is no outer transaction,
+        # so don't call this inside an atomic block.
+        with transaction.atomic():
+            # Use the project id to avoid loading the project through the group.
+            activity = Activity.objects.create(
+                group=group,
+                project_id=group.project_id,
+                type=Activity.NOTE,
+                user=user,
+                data={'text': self.cleaned_data['text']},
+            )
         activity.send_notification()
 
         return activity
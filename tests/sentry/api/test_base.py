@@ -77,3 +77,21 @@ class EndpointJSONBodyTest(APITestCase):
         Endpoint().load_json_body(self.request)
 
         assert not self.request.json_body
+
+
+class EndpointCursorLinkTest(APITestCase):
+    def test_build_cursor_link(self):
+        request = HttpRequest()
+        request.method = 'GET'
+        request.path = '/api/0/foo/'
+        request.GET['query'] = 'is:unresolved'
+        request.GET['cursor'] = '0:0:0'
+
+        base_url = Endpoint().build_cursor_base_url(request)
+        assert base_url.endswith('/api/0/foo/?query=is%3Aunresolved')
+
+        link = Endpoint().build_cursor_link(request, 'next', '0:100:0', base_url=base_url)
+        assert link == Endpoint().build_cursor_link(request, 'next', '0:100:0')
+        assert link == (
+            u'<{0}&cursor=0:100:0>; rel="next"; results="true"; cursor="0:100:0"'.format(base_url)
+        )
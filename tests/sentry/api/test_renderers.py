@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import
+
+from collections import namedtuple
+from datetime import datetime
+from decimal import Decimal
+
+from rest_framework.renderers import JSONRenderer as RestFrameworkJSONRenderer
+
+from sentry.api.renderers import JSONRenderer
+from sentry.testutils import TestCase
+
+
+Point = namedtuple('Point', ['x', 'y'])
+
+
+class JSONRendererTest(TestCase):
+    def test_matches_rest_framework(self):
+        data = {
+            'text': u'caf\xe9 \u2028',
+            'date': datetime(2019, 1, 1, 12, 30, 15, 123456),
+            'amount': Decimal('1.5'),
+            'point': Point(1, 2),
+            'items': [1, None, True],
+        }
+        expected = RestFrameworkJSONRenderer().render(data)
+        assert JSONRenderer().render(data) == expected
+
+    def test_none(self):
+        assert JSONRenderer().render(None) == b''
+
+    def test_indent(self):
+        result = JSONRenderer().render({'foo': 'bar'}, 'application/json; indent=2')
+        assert result == b'{\n  "foo": "bar"\n}'
@@ -1,6 +1,9 @@
 from __future__ import absolute_import
 
-from sentry.lang.native.utils import get_sdk_from_event, is_minidump_event
+from sentry.lang.native.utils import (
+    _parse_os_version, get_sdk_from_event, get_sdk_from_os, image_name, is_minidump_event,
+    is_native_event
+)
 
 
 def test_get_sdk_from_event():
@@ -39,6 +42,34 @@ def test_get_sdk_from_event():
     assert sdk_info['version_patchlevel'] == 1
 
 
+def test_get_sdk_from_os():
+    assert get_sdk_from_os({'name': 'iOS', 'version': '10.2-beta'}) == {
+        'sdk_name': 'iOS',
+        'version_major': 10,
+        'version_minor': 2,
+        'version_patchlevel': 0,
+        'build': None,
+    }
+    assert get_sdk_from_os({'name': 'iOS', 'version': 'unknown'}) is None
+    assert get_sdk_from_os({'name': 'iOS'}) is None
+
+
+def test_get_sdk_from_os_caches_versions():
+    get_sdk_from_os({'name': 'iOS', 'version': '11.4.1'})
+    hits = _parse_os_version.cache_info().hits
+
+    sdk_info = get_sdk_from_os({'name': 'iPadOS', 'version': '11.4.1'})
+    assert _parse_os_version.cache_info().hits == hits + 1
+    assert sdk_info['sdk_name'] == 'iPadOS'
+    assert sdk_info['version_patchlevel'] == 1
+
+    # Invalid versions are cached as well.
+    get_sdk_from_os({'name': 'iOS', 'version': 'unknown'})
+    hits = _parse_os_version.cache_info().hits
+    assert get_sdk_from_os({'name': 'iOS', 'version': 'unknown'}) is None
+    assert _parse_os_version.cache_info().hits == hits + 1
+
+
 def test_is_minidump():
     assert is_minidump_event({
         'exception': {
@@ -99,3 +130,45 @@ def test_is_minidump():
     assert not is_minidump_event({
         'exception': None
     })
+
+
+def test_image_name():
+    assert image_name(None) is None
+    assert image_name('') == ''
+    assert image_name('/usr/lib/libc.so.6') == 'libc.so.6'
+    assert image_name('C:\\Windows\\System32\\kernel32.dll') == 'kernel32.dll'
+    assert image_name('c:\\Windows\\System32\\kernel32.dll') == 'kernel32.dll'
+    assert image_name('\\\\server\\share\\app.exe') == 'app.exe'
+    assert image_name('1:\\foo/bar\\baz') == 'bar\\baz'
+    assert image_name('libfoo.dylib') == 'libfoo.dylib'
+
+
+def test_is_native_event():
+    assert is_native_event({'platform': 'native'})
+    assert is_native_event({'platform': 'cocoa'})
+    assert not is_native_event({'platform': 'javascript'})
+
+    assert is_native_event({
+        'platform': 'javascript',
+        'exception': {
+            'values': [
+                None,
+                {'stacktrace': {'frames': [{'platform': 'javascript'}]}},
+                {'stacktrace': {'frames': [None, {'platform': 'cocoa'}]}},
+            ]
+        }
+    })
+
+    assert is_native_event({
+        'platform': 'javascript',
+        'threads': {
+            'values': [{'stacktrace': {'frames': [{'platform': 'native'}]}}]
+        }
+    })
+
+    assert not is_native_event({
+        'platform': 'javascript',
+        'stacktrace': {'frames': [{'platform': 'javascript'}, {}]},
+        'exception': {'values': [{'stacktrace': None}]},
+        'threads': {'values': None},
+    })
@@ -13,7 +13,9 @@ from sentry.ownership.grammar import Rule, Matcher, Owner, dump_schema
 from sentry.testutils import TestCase
 from sentry.testutils.helpers import with_feature
 from sentry.tasks.merge import merge_groups
-from sentry.tasks.post_process import index_event_tags, post_process_group
+from sentry.tasks.post_process import (
+    _should_send_error_created_hooks, index_event_tags, post_process_group
+)
 
 
 class PostProcessGroupTest(TestCase):
@@ -270,8 +272,8 @@ class PostProcessGroupTest(TestCase):
         assignee = event.group.assignee_set.first()
         assert assignee is None
 
-    @patch('sentry.tasks.servicehooks.process_service_hook')
-    def test_service_hook_fires_on_new_event(self, mock_process_service_hook):
+    @patch('sentry.tasks.servicehooks.process_service_hooks')
+    def test_service_hook_fires_on_new_event(self, mock_process_service_hooks):
         group = self.create_group(project=self.project)
         event = self.create_event(group=group)
 
@@ -291,14 +293,14 @@ class PostProcessGroupTest(TestCase):
                 is_new_group_environment=False,
             )
 
-        mock_process_service_hook.delay.assert_called_once_with(
-            servicehook_id=hook.id,
+        mock_process_service_hooks.delay.assert_called_once_with(
+            servicehook_ids=[hook.id],
             event=event,
         )
 
-    @patch('sentry.tasks.servicehooks.process_service_hook')
+    @patch('sentry.tasks.servicehooks.process_service_hooks')
     @patch('sentry.rules.processor.RuleProcessor')
-    def test_service_hook_fires_on_alert(self, mock_processor, mock_process_service_hook):
+    def test_service_hook_fires_on_alert(self, mock_processor, mock_process_service_hooks):
         group = self.create_group(project=self.project)
         event = self.create_event(group=group)
 
@@ -325,15 +327,15 @@ class PostProcessGroupTest(TestCase):
                 is_new_group_environment=False,
             )
 
-        mock_process_service_hook.delay.assert_called_once_with(
-            servicehook_id=hook.id,
+        mock_process_service_hooks.delay.assert_called_once_with(
+            servicehook_ids=[hook.id],
             event=event,
         )
 
-    @patch('sentry.tasks.servicehooks.process_service_hook')
+    @patch('sentry.tasks.servicehooks.process_service_hooks')
     @patch('sentry.rules.processor.RuleProcessor')
     def test_service_hook_does_not_fire_without_alert(
-            self, mock_processor, mock_process_service_hook):
+            self, mock_processor, mock_process_service_hooks):
         group = self.create_group(project=self.project)
         event = self.create_event(group=group)
 
@@ -355,10 +357,10 @@ class PostProcessGroupTest(TestCase):
                 is_new_group_environment=False,
             )
 
-        assert not mock_process_service_hook.delay.mock_calls
+        assert not mock_process_service_hooks.delay.mock_calls
 
-    @patch('sentry.tasks.servicehooks.process_service_hook')
-    def test_service_hook_does_not_fire_without_event(self, mock_process_service_hook):
+    @patch('sentry.tasks.servicehooks.process_service_hooks')
+    def test_service_hook_does_not_fire_without_event(self, mock_process_service_hooks):
         group = self.create_group(project=self.project)
         event = self.create_event(group=group)
 
@@ -378,7 +380,7 @@ class PostProcessGroupTest(TestCase):
                 is_new_group_environment=False,
             )
 
-        assert not mock_process_service_hook.delay.mock_calls
+        assert not mock_process_service_hooks.delay.mock_calls
 
     @patch('sentry.tasks.sentry_apps.process_resource_change_bound.delay')
     def test_processes_resource_change_task_on_new_group(self, delay):
@@ -556,6 +558,46 @@ class PostProcessGroupTest(TestCase):
         )
 
 
+class ShouldSendErrorCreatedHooksTest(TestCase):
+    def setUp(self):
+        self.cache_key = u'servicehooks-error-created:1:{}'.format(self.project.id)
+
+    @patch('sentry.tasks.post_process.cache')
+    def test_feature_disabled_uses_negative_ttl(self, mock_cache):
+        mock_cache.get.return_value = None
+
+        with self.options({'post-process.error-hook-negative-cache-ttl': 300}):
+            assert not _should_send_error_created_hooks(self.project)
+
+        mock_cache.set.assert_called_once_with(self.cache_key, 0, 300)
+
+    @with_feature('organizations:integrations-event-hooks')
+    @patch('sentry.tasks.post_process.cache')
+    def test_no_hooks_uses_negative_ttl(self, mock_cache):
+        mock_cache.get.return_value = None
+
+        with self.options({'post-process.error-hook-negative-cache-ttl': 300}):
+            assert not _should_send_error_created_hooks(self.project)
+
+        mock_cache.set.assert_called_once_with(self.cache_key, 0, 300)
+
+    @with_feature('organizations:integrations-event-hooks')
+    @patch('sentry.tasks.post_process.cache')
+    def test_hook_uses_positive_ttl(self, mock_cache):
+        mock_cache.get.return_value = None
+        self.create_service_hook(
+            project=self.project,
+            organization=self.project.organization,
+            actor=self.user,
+            events=['error.created'],
+        )
+
+        with self.options({'post-process.error-hook-negative-cache-ttl': 300}):
+            assert _should_send_error_created_hooks(self.project)
+
+        mock_cache.set.assert_called_once_with(self.cache_key, 1, 60)
+
+
 class IndexEventTagsTest(TestCase):
     def test_simple(self):
         group = self.create_group(project=self.project)
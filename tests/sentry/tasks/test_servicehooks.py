@@ -3,7 +3,9 @@ from __future__ import absolute_import
 from mock import patch
 
 from sentry.testutils import TestCase
-from sentry.tasks.servicehooks import get_payload_v0, process_service_hook
+from sentry.tasks.servicehooks import (
+    get_payload_v0, process_service_hook, process_service_hooks
+)
 from sentry.testutils.helpers.faux import faux
 from sentry.utils import json
 
@@ -66,3 +68,20 @@ class TestServiceHooks(TestCase):
             'X-ServiceHook-GUID',
             'X-ServiceHook-Signature',
         ))
+
+    @patch('sentry.tasks.servicehooks.safe_urlopen')
+    def test_process_service_hooks_sends_each_hook(self, safe_urlopen):
+        other_hook = self.create_service_hook(
+            project=self.project,
+            events=('event.created', ),
+            url='https://example.com/sentry/other-webhook',
+        )
+
+        event = self.create_event(project=self.project)
+
+        process_service_hooks([self.hook.id, other_hook.id], event)
+
+        assert [c[1]['url'] for c in safe_urlopen.call_args_list] == [
+            self.hook.url,
+            other_hook.url,
+        ]
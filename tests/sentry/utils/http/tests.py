@@ -293,6 +293,10 @@ class IsValidReleaseTestCase(TestCase):
     def test_garbage_data(self):
         assert self.is_valid_release(1, ['1.2.3'])
 
+    def test_bad_pattern_is_ignored(self):
+        assert self.is_valid_release('1.2.3', ['[z-a]'])
+        assert not self.is_valid_release('1.2.3', ['[z-a]', '1.2.*'])
+
 
 class IsValidErrorMessageTestCase(TestCase):
     def is_valid_error_message(self, value, inputs):
@@ -331,6 +335,13 @@ class IsValidErrorMessageTestCase(TestCase):
         ]
         assert self.is_valid_error_message('it bad', patterns)
 
+    def test_bad_pattern_does_not_skip_others(self):
+        patterns = [
+            u"*google_tag_manager['GTM-3TL3'].macro(...)*",
+            u'It *',
+        ]
+        assert not self.is_valid_error_message('it bad', patterns)
+
 
 class OriginFromRequestTestCase(TestCase):
     def test_nothing(self):
@@ -1 +1,24 @@
 from __future__ import absolute_import
+
+from mock import patch
+
+from sentry.models import Activity, Group
+from sentry.testutils import TestCase
+from sentry.web.forms import NewNoteForm
+
+
+class NewNoteFormTest(TestCase):
+    @patch('sentry.tasks.activity.send_activity_notifications.delay')
+    def test_save(self, mock_send_activity_notifications):
+        group = self.create_group()
+        num_comments = group.num_comments
+
+        form = NewNoteForm({'text': 'hello world'})
+        assert form.is_valid()
+        activity = form.save(group, self.user)
+
+        assert activity.type == Activity.NOTE
+        assert activity.project_id == group.project_id
+        assert activity.data == {'text': 'hello world'}
+        assert Group.objects.get(id=group.id).num_comments == num_comments + 1
+        mock_send_activity_notifications.assert_called_once_with(activity.id)